@@ -4,7 +4,11 @@ Provides tools to process DOCX files and apply numbering formatting directly
 into the document text.
 """
 
-from .api import DocxNumberingProcessor, add_numbering_to_docx
+from .api import (
+    DocxNumberingProcessor,
+    add_numbering_to_docx,
+    add_numbering_to_docx_batch,
+)
 from .exceptions import (
     DocxNumberingError,
     DocxProcessingError,
@@ -17,6 +21,7 @@ from .pandoc_utils import convert_docx_to_format
 
 __all__ = [
     "add_numbering_to_docx",
+    "add_numbering_to_docx_batch",
     "DocxNumberingProcessor",
     "convert_docx_to_format",
     "DocxNumberingError",
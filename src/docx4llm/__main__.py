@@ -0,0 +1,6 @@
+"""Allow running the CLI with ``python -m docx4llm``."""
+
+from docx4llm.cli import main_cli
+
+if __name__ == "__main__":
+    main_cli()
@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from lxml import etree
-
-from docx4llm import xml_utils
-from docx4llm.constants import DOCX_DOCUMENT_PART
+from docx4llm.constants import W_P, W_RSIDDEL
 from docx4llm.document_modifier import (
     DocumentCleaner,
     ParagraphFormatter,
@@ -17,19 +15,35 @@ from docx4llm.document_modifier import (
 from docx4llm.docx_io import DocxFileHandler
 from docx4llm.exceptions import DocxProcessingError
 from docx4llm.numbering_formats import NumberingFormatterService
-from docx4llm.xml_parser import NumberingParser
+from docx4llm.xml_parser import NumberingParser, ParsedNumbering
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from lxml.etree import _Element as EtreeElement
+
+
+# Formatters are stateless, so every processor shares one service.
+_DEFAULT_FORMATTER_SERVICE = NumberingFormatterService()
 
 
 class DocxNumberingProcessor:
     """Orchestrates the DOCX numbering application process."""
 
-    def __init__(self) -> None:
-        """Initialize the processor."""
-        self._formatter_service = NumberingFormatterService()
-        self._numbering_parser = NumberingParser(self._formatter_service)
+    def __init__(
+        self,
+        formatter_service: NumberingFormatterService | None = None,
+    ) -> None:
+        """Initialize the processor.
+
+        Args:
+            formatter_service: Service providing the number formatters;
+                               defaults to a shared module-level instance.
+
+        """
+        self._formatter_service = (
+            formatter_service or _DEFAULT_FORMATTER_SERVICE
+        )
 
     def process_docx(
         self,
@@ -65,55 +79,49 @@ class DocxNumberingProcessor:
 
     def _process_files_in_handler(self, docx_handler: DocxFileHandler) -> None:
         """Internal logic to process XML files from the unpacked DOCX."""
-        numbering_xml_content = docx_handler.get_numbering_xml_content()
-        if numbering_xml_content:
-            self._numbering_parser.parse_numbering_xml(numbering_xml_content)
-
-        document_xml_content = docx_handler.get_document_xml_content()
-        if not document_xml_content:
-            raise DocxProcessingError(
-                f"Core part {DOCX_DOCUMENT_PART} is missing or unreadable.",
-            )
-
-        modified_document_bytes = self._process_document_xml(
-            document_xml_content,
-        )
-        docx_handler.write_document_xml_content(modified_document_bytes)
-
-    def _process_document_xml(self, document_xml_content: bytes) -> bytes:
-        """Modify the document.xml content.
+        numbering = ParsedNumbering()
+        numbering_part = docx_handler.open_numbering_xml()
+        if numbering_part is not None:
+            with numbering_part:
+                numbering = NumberingParser.parse(
+                    numbering_part,
+                    self._formatter_service,
+                )
+
+        document_tree = docx_handler.parse_document_xml()
+        self._process_document_root(document_tree.getroot(), numbering)
+        docx_handler.write_document_xml_tree(document_tree)
+
+    @staticmethod
+    def _process_document_root(
+        document_root: EtreeElement,
+        numbering: ParsedNumbering,
+    ) -> None:
+        """Modify the parsed document.xml tree in place.
 
         Args:
-            document_xml_content: Byte content of the original document.xml.
-
-        Returns:
-            Byte content of the modified document.xml.
+            document_root: The root element of document.xml.
+            numbering: The document's parsed numbering definitions.
 
         """
-        document_root = etree.fromstring(document_xml_content)
-
-        DocumentCleaner.clean_numbering_references(document_root)
-
-        paragraph_formatter = ParagraphFormatter(
-            self._numbering_parser.numbering_definitions,
-        )
-
-        for paragraph_elem in xml_utils.find_all_elements(
-            document_root,
-            "//w:p",
-        ):
-            num_prefix = paragraph_formatter.format_paragraph(paragraph_elem)
-            if num_prefix:
-                add_numbering_prefix_to_paragraph(paragraph_elem, num_prefix)
+        paragraph_formatter = ParagraphFormatter(numbering.definitions)
+
+        # Every w:numPr in a paragraph is stripped right after it is
+        # formatted, so the tracked-change cleanup only matters for deleted
+        # paragraphs, which must not be numbered or advance the counters.
+        for paragraph_elem in document_root.iter(W_P):
+            if paragraph_elem.get(W_RSIDDEL) is None:
+                num_prefix = paragraph_formatter.format_paragraph(
+                    paragraph_elem,
+                )
+                if num_prefix:
+                    add_numbering_prefix_to_paragraph(
+                        paragraph_elem,
+                        num_prefix,
+                    )
 
             DocumentCleaner.remove_all_numpr_tags(paragraph_elem)
 
-        return etree.tostring(
-            document_root,
-            encoding="utf-8",
-            xml_declaration=True,
-        )
-
 
 def add_numbering_to_docx(
     input_docx_path: str | Path,
@@ -139,3 +147,78 @@ def add_numbering_to_docx(
         return True
     except DocxProcessingError:
         return False
+
+
+def _add_numbering_to_docx_pair(
+    docx_paths: tuple[str | Path, str | Path],
+) -> bool:
+    """Run add_numbering_to_docx on an (input, output) pair in a worker."""
+    return add_numbering_to_docx(*docx_paths)
+
+
+def add_numbering_to_docx_batch(
+    docx_paths: Iterable[tuple[str | Path, str | Path]],
+    max_workers: int | None = None,
+) -> list[bool]:
+    """Apply numbering to several DOCX files in parallel worker processes.
+
+    Documents are independent, so each one is processed by
+    add_numbering_to_docx in its own worker process.
+
+    Args:
+        docx_paths: (input path, output path) pairs, one per document.
+        max_workers: Number of worker processes; defaults to one per CPU,
+                     but never more than the number of documents.
+
+    Returns:
+        One result per pair, in input order: True if that document was
+        processed successfully, False otherwise.
+
+    """
+    return list(
+        map_in_worker_processes(
+            _add_numbering_to_docx_pair,
+            list(docx_paths),
+            max_workers=max_workers,
+        ),
+    )
+
+
+def map_in_worker_processes[T, R](
+    function: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: int | None = None,
+    chunksize: int | None = None,
+) -> Iterator[R]:
+    """Call function on each item, spreading the calls over worker processes.
+
+    A single item is processed in the calling process, without starting a
+    pool.
+
+    Args:
+        function: A picklable callable, e.g. a module-level function or a
+                  functools.partial of one, taking a single item.
+        items: The items to process.
+        max_workers: Number of worker processes; defaults to one per CPU,
+                     but never more than the number of items.
+        chunksize: Number of items sent to a worker at a time; defaults to
+                   about a quarter of each worker's share, so every worker
+                   gets items while the pool still balances uneven ones.
+
+    Yields:
+        One result per item, in item order, as soon as it is available.
+
+    """
+    if len(items) <= 1:
+        yield from map(function, items)
+        return
+    # Imported here so that importing docx4llm for single documents doesn't
+    # pay for loading concurrent.futures and multiprocessing.
+    from concurrent.futures import ProcessPoolExecutor  # ruff: ignore[import-outside-top-level]
+
+    if max_workers is None:
+        max_workers = min(len(items), os.cpu_count() or 1)
+    if chunksize is None:
+        chunksize = max(1, len(items) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(function, items, chunksize=chunksize)
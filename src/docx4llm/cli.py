@@ -1,6 +1,9 @@
 """Command Line Interface for DOCX Numbering Processor."""
 
+import argparse
+import functools
 import logging
+import logging.handlers
 import shutil
 import sys
 from datetime import datetime
@@ -9,31 +12,45 @@ from typing import cast
 
 try:
     from docx4llm import (
+        DocxNumberingProcessor,
         DocxProcessingError,
         PandocConversionError,
         PandocNotInstalledError,
         add_numbering_to_docx,
         convert_docx_to_format,
     )
+    from docx4llm.api import map_in_worker_processes
     from docx4llm.pandoc_utils import TrackChangesOption
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parent))
     from docx4llm import (
+        DocxNumberingProcessor,
         DocxProcessingError,
         PandocConversionError,
         PandocNotInstalledError,
         add_numbering_to_docx,
         convert_docx_to_format,
     )
+    from docx4llm.api import map_in_worker_processes
     from docx4llm.pandoc_utils import TrackChangesOption
 
 
 ERROR_LOG_FILENAME = "DocxNumConvert_error.log"
+ERROR_LOG_BUFFER_CAPACITY = 32
+PANDOC_NOT_FOUND_MESSAGE = (
+    "Pandoc не найден. Для конвертации файлов установите Pandoc "
+    "(https://pandoc.org/installing.html)."
+)
 _error_file_logger: logging.Logger | None = None
 
 
 def _get_error_file_logger() -> logging.Logger:
-    """Initialize and return the dedicated error file logger."""
+    """Initialize and return the dedicated error file logger.
+
+    The log file is opened on the first call, which only happens once there
+    is an error to report. Records are buffered and written in batches; the
+    buffer is flushed by logging.shutdown() when the interpreter exits.
+    """
     global _error_file_logger
     if _error_file_logger is None:
         _error_file_logger = logging.getLogger("DocxNumConvertErrorFile")
@@ -41,8 +58,7 @@ def _get_error_file_logger() -> logging.Logger:
         _error_file_logger.propagate = False
 
         if not any(
-            isinstance(h, logging.FileHandler)
-            and Path(getattr(h, 'baseFilename', ''))
+            Path(getattr(getattr(h, "target", h), "baseFilename", ""))
             == Path.cwd() / ERROR_LOG_FILENAME
             for h in _error_file_logger.handlers
         ):
@@ -57,7 +73,13 @@ def _get_error_file_logger() -> logging.Logger:
                     datefmt="%Y-%m-%d %H:%M:%S",
                 )
                 file_handler.setFormatter(file_formatter)
-                _error_file_logger.addHandler(file_handler)
+                _error_file_logger.addHandler(
+                    logging.handlers.MemoryHandler(
+                        ERROR_LOG_BUFFER_CAPACITY,
+                        flushLevel=logging.CRITICAL,
+                        target=file_handler,
+                    ),
+                )
             except IOError as e:
                 print(
                     f"КРИТИЧЕСКАЯ ОШИБКА: Не удалось инициализировать лог-файл "
@@ -120,13 +142,226 @@ def ask_yes_no(prompt: str) -> bool:
         print("Пожалуйста, ответьте 'да' или 'нет'.")
 
 
+@functools.lru_cache(maxsize=1)
 def check_pandoc_installed() -> bool:
-    """Check if Pandoc executable is found in PATH."""
+    """Check if Pandoc executable is found in PATH.
+
+    The PATH lookup runs once; later calls return the cached result.
+    """
     return shutil.which("pandoc") is not None
 
 
-def main_cli() -> None:
-    """Main function for the Command Line Interface."""
+def get_numbered_output_path(input_path: Path) -> Path:
+    """Return the path the numbered copy of input_path is saved to."""
+    return input_path.parent / f"{input_path.stem}_numbered{input_path.suffix}"
+
+
+def _process_one(
+    input_path: Path,
+    output_path: Path | None,
+    output_format: str | None,
+    track_changes: TrackChangesOption,
+) -> tuple[Path, Path, str | None]:
+    """Process a single DOCX file and optionally convert it with Pandoc.
+
+    Processing, conversion and file system errors are returned rather than
+    logged, so that only the parent process writes to the error log file;
+    anything else is a bug and propagates.
+
+    Args:
+        input_path: Path to the .docx file to process.
+        output_path: Where to save the numbered copy; defaults to
+                     get_numbered_output_path(input_path).
+        output_format: Pandoc output format, or None to skip conversion.
+        track_changes: How Pandoc handles tracked changes.
+
+    Returns:
+        The input path, the path of the resulting file and an error message,
+        or None if the file was processed successfully.
+
+    """
+    if output_path is None:
+        output_path = get_numbered_output_path(input_path)
+    if not input_path.is_file() or input_path.suffix.lower() != ".docx":
+        return input_path, output_path, "Файл не найден или не является DOCX"
+    try:
+        DocxNumberingProcessor().process_docx(input_path, output_path)
+        if output_format:
+            converted_file_path = convert_docx_to_format(
+                output_path,
+                output_format,
+                track_changes=track_changes,
+            )
+            return input_path, Path(converted_file_path), None
+    except (
+        DocxProcessingError,
+        PandocNotInstalledError,
+        PandocConversionError,
+        OSError,
+    ) as err:
+        return input_path, output_path, str(err)
+    return input_path, output_path, None
+
+
+def run_batch(
+    input_paths: list[Path],
+    output_path: Path | None = None,
+    output_format: str | None = None,
+    track_changes: TrackChangesOption = "all",
+) -> None:
+    """Process DOCX files without any prompts.
+
+    Several files are processed in parallel, one worker process per core.
+    Failed files are reported and logged, and the process exits with
+    status 1 if any failed.
+
+    Args:
+        input_paths: Paths to the .docx files to process.
+        output_path: Where to save the numbered copy of a single input file;
+                     by default each copy is saved next to its source.
+        output_format: Pandoc output format, or None to skip conversion.
+        track_changes: How Pandoc handles tracked changes.
+
+    """
+    if output_format and not check_pandoc_installed():
+        log_error_and_exit(PANDOC_NOT_FOUND_MESSAGE, None)
+
+    results = map_in_worker_processes(
+        functools.partial(
+            _process_one,
+            output_path=output_path,
+            output_format=output_format,
+            track_changes=track_changes,
+        ),
+        input_paths,
+    )
+    failed_count = 0
+    for input_path, result_path, error in results:
+        if error is None:
+            print(
+                f"Файл '{input_path}' успешно обработан и сохранен как "
+                f"'{result_path}'",
+            )
+            continue
+        failed_count += 1
+        print(
+            f"ОШИБКА: не удалось обработать файл '{input_path}': {error}",
+            file=sys.stderr,
+        )
+        _get_error_file_logger().error(
+            f"Ошибка при обработке DOCX файла '{input_path}'\n"
+            f"  Подробности ошибки: {error}",
+        )
+
+    print(
+        f"Обработано файлов: {len(input_paths) - failed_count} "
+        f"из {len(input_paths)}.",
+    )
+    if failed_count:
+        print(
+            f"Подробности ошибок сохранены в файле: {ERROR_LOG_FILENAME}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser for main_cli."""
+    arg_parser = argparse.ArgumentParser(
+        prog="docx-num-converter",
+        description="Обработчик нумерации DOCX.",
+    )
+    arg_parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help="DOCX файлы для обработки; без них запускается диалог",
+    )
+    arg_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="путь для обработанного DOCX (только для одного файла)",
+    )
+    arg_parser.add_argument(
+        "-f",
+        "--format",
+        help="сконвертировать обработанный файл в этот формат Pandoc",
+    )
+    arg_parser.add_argument(
+        "--track-changes",
+        choices=["all", "accept", "reject"],
+        default="all",
+        help="режим отслеживания изменений при конвертации (по умолчанию all)",
+    )
+    return arg_parser
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """Parse the command line, rejecting options that don't fit together."""
+    arg_parser = _build_arg_parser()
+    args = arg_parser.parse_args(argv)
+    if args.paths:
+        if args.output is not None and len(args.paths) > 1:
+            arg_parser.error("--output можно указать только для одного файла")
+    elif args.output is not None or args.format:
+        arg_parser.error("--output и --format требуют путь к DOCX файлу")
+    return args
+
+
+def _ask_track_changes() -> TrackChangesOption:
+    """Ask how Pandoc should handle tracked changes, defaulting to "all"."""
+    default_track_changes: TrackChangesOption = "all"
+    print("\nРежим отслеживания изменений при конвертации:")
+    print(f" - {default_track_changes} (сохранить все изменения и комментарии)")
+    print(" - accept (принять все изменения)")
+    print(" - reject (отклонить все изменения)")
+
+    user_track_changes_str = get_user_input(
+        f"Введите режим отслеживания изменений (или Enter для '{default_track_changes}'): ",
+    )
+
+    track_changes_to_use: TrackChangesOption = default_track_changes
+    if user_track_changes_str:
+        valid_literal_options: list[TrackChangesOption] = [
+            "all",
+            "accept",
+            "reject",
+        ]
+        if user_track_changes_str.lower() in valid_literal_options:
+            track_changes_to_use = cast(
+                TrackChangesOption,
+                user_track_changes_str.lower(),
+            )
+        else:
+            print(
+                f"Предупреждение: Введенный режим '{user_track_changes_str}' "
+                f"не распознан. Будет использован режим '{default_track_changes}'.",
+            )
+    return track_changes_to_use
+
+
+def main_cli(argv: list[str] | None = None) -> None:
+    """Main function for the Command Line Interface.
+
+    With DOCX paths on the command line, the files are processed without any
+    prompts, several of them in parallel. Otherwise the interactive dialog
+    runs.
+
+    Args:
+        argv: Command line arguments, defaults to sys.argv[1:].
+
+    """
+    args = _parse_args(argv)
+    if args.paths:
+        run_batch(
+            args.paths,
+            output_path=args.output,
+            output_format=args.format,
+            track_changes=args.track_changes,
+        )
+        return
+
     print("--- Обработчик нумерации DOCX ---")
 
     input_docx_path_str: str
@@ -154,11 +389,7 @@ def main_cli() -> None:
         print("Пожалуйста, попробуйте снова.")
 
     input_path = Path(input_docx_path_str)
-    dir_name = input_path.parent
-    name_without_ext = input_path.stem
-    ext = input_path.suffix
-
-    output_docx_processed_path = dir_name / f"{name_without_ext}_numbered{ext}"
+    output_docx_processed_path = get_numbered_output_path(input_path)
 
     print(f"Файл будет обработан и сохранен как: {output_docx_processed_path}")
     print(f"Начинаю обработку файла: {input_path}...")
@@ -197,11 +428,7 @@ def main_cli() -> None:
         return
 
     if not check_pandoc_installed():
-        err_msg = (
-            "Pandoc не найден. Для конвертации файлов установите Pandoc "
-            "(https://pandoc.org/installing.html)."
-        )
-        log_error_and_exit(err_msg, None)
+        log_error_and_exit(PANDOC_NOT_FOUND_MESSAGE, None)
 
     print(
         "\nДоступные форматы для конвертации (некоторые могут требовать "
@@ -224,33 +451,7 @@ def main_cli() -> None:
         if not output_format:
             print("Формат не может быть пустым.")
 
-    default_track_changes: TrackChangesOption = "all"
-    print("\nРежим отслеживания изменений при конвертации:")
-    print(f" - {default_track_changes} (сохранить все изменения и комментарии)")
-    print(" - accept (принять все изменения)")
-    print(" - reject (отклонить все изменения)")
-
-    user_track_changes_str = get_user_input(
-        f"Введите режим отслеживания изменений (или Enter для '{default_track_changes}'): ",
-    )
-
-    track_changes_to_use: TrackChangesOption = default_track_changes
-    if user_track_changes_str:
-        valid_literal_options: list[TrackChangesOption] = [
-            "all",
-            "accept",
-            "reject",
-        ]
-        if user_track_changes_str.lower() in valid_literal_options:
-            track_changes_to_use = cast(
-                TrackChangesOption,
-                user_track_changes_str.lower(),
-            )
-        else:
-            print(
-                f"Предупреждение: Введенный режим '{user_track_changes_str}' "
-                f"не распознан. Будет использован режим '{default_track_changes}'.",
-            )
+    track_changes_to_use = _ask_track_changes()
 
     print(
         f"\nНачинаю конвертацию файла '{output_docx_processed_path}' "
@@ -291,5 +492,4 @@ def main_cli() -> None:
 
 
 if __name__ == "__main__":
-    _get_error_file_logger()
     main_cli()
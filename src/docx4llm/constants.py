@@ -5,7 +5,36 @@ WORDPROCESSINGML_NAMESPACE = (
 )
 NAMESPACES = {"w": WORDPROCESSINGML_NAMESPACE}
 
+W_P = f"{{{WORDPROCESSINGML_NAMESPACE}}}p"
+W_PPR = f"{{{WORDPROCESSINGML_NAMESPACE}}}pPr"
+W_R = f"{{{WORDPROCESSINGML_NAMESPACE}}}r"
+W_RPR = f"{{{WORDPROCESSINGML_NAMESPACE}}}rPr"
+W_T = f"{{{WORDPROCESSINGML_NAMESPACE}}}t"
+W_NUMPR = f"{{{WORDPROCESSINGML_NAMESPACE}}}numPr"
+W_ILVL = f"{{{WORDPROCESSINGML_NAMESPACE}}}ilvl"
+W_NUMID = f"{{{WORDPROCESSINGML_NAMESPACE}}}numId"
+W_ABSTRACTNUM = f"{{{WORDPROCESSINGML_NAMESPACE}}}abstractNum"
+W_ABSTRACTNUMID = f"{{{WORDPROCESSINGML_NAMESPACE}}}abstractNumId"
+W_NUM = f"{{{WORDPROCESSINGML_NAMESPACE}}}num"
+W_NUMFMT = f"{{{WORDPROCESSINGML_NAMESPACE}}}numFmt"
+W_LVL = f"{{{WORDPROCESSINGML_NAMESPACE}}}lvl"
+W_LVLOVERRIDE = f"{{{WORDPROCESSINGML_NAMESPACE}}}lvlOverride"
+W_LVLTEXT = f"{{{WORDPROCESSINGML_NAMESPACE}}}lvlText"
+W_START = f"{{{WORDPROCESSINGML_NAMESPACE}}}start"
+W_STARTOVERRIDE = f"{{{WORDPROCESSINGML_NAMESPACE}}}startOverride"
+W_RSIDDEL = f"{{{WORDPROCESSINGML_NAMESPACE}}}rsidDel"
+W_VAL = f"{{{WORDPROCESSINGML_NAMESPACE}}}val"
+
+# WordprocessingML attributes share their Clark names with the elements of
+# the same local name, so the tag constants double as attribute names.
+W_ATTRIBUTES = {
+    "abstractNumId": W_ABSTRACTNUMID,
+    "ilvl": W_ILVL,
+    "numId": W_NUMID,
+    "val": W_VAL,
+}
+
 DOCX_NUMBERING_PART = "word/numbering.xml"
 DOCX_DOCUMENT_PART = "word/document.xml"
 
-TEMP_DIR_SUFFIX = "_num_proc_temp"
+COPY_BUFFER_SIZE = 1 << 20
@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import copy
+from typing import TYPE_CHECKING, cast
 
-from docx4llm import xml_utils
+from lxml import etree
+
+from docx4llm.constants import (
+    NAMESPACES,
+    W_NUMPR,
+    W_PPR,
+    W_R,
+    W_RPR,
+    W_T,
+)
+from docx4llm.xml_parser import parse_numpr_info
 
 if TYPE_CHECKING:
     from lxml.etree import _Element as EtreeElement
 
-    from docx4llm.numbering_domain import NumberingDefinition
-    from docx4llm.xml_parser import parse_numpr_info
+    from docx4llm.numbering_domain import NumberingDefinition, NumberingLevel
+
+
+_NUMPR_XPATH = etree.XPath("./w:pPr/w:numPr[1]", namespaces=NAMESPACES)
 
 
 class ParagraphFormatter:
@@ -27,7 +40,7 @@ class ParagraphFormatter:
                                    definitions, keyed by numId.
         """
         self._numbering_definitions = numbering_definitions
-        self._last_active_levels: dict[str, str] = {}
+        self._last_active_levels: dict[str, int | None] = {}
 
     def format_paragraph(self, paragraph_element: EtreeElement) -> str | None:
         """Formats a single paragraph element, returning its number prefix.
@@ -42,98 +55,51 @@ class ParagraphFormatter:
             The numbering prefix string (e.g., "1. ", "a) ") if numbering
             is applied, otherwise None.
         """
-        paragraph_properties = xml_utils.find_element(
-            paragraph_element,
-            ".//w:pPr",
-        )
-        if paragraph_properties is None:
+        num_pr_elements = _NUMPR_XPATH(paragraph_element)
+        if not isinstance(num_pr_elements, list) or not num_pr_elements:
             return None
+        num_pr_element = cast("EtreeElement", num_pr_elements[0])
 
-        num_pr_element = xml_utils.find_element(
-            paragraph_properties,
-            ".//w:numPr",
-        )
-
-        from .xml_parser import parse_numpr_info  # noqa: PLC0415
-
-        ilvl_str, num_id_str = parse_numpr_info(num_pr_element)
-
-        if not self._is_valid_numbering_info(ilvl_str, num_id_str):
+        ilvl, num_id = parse_numpr_info(num_pr_element)
+        if not (ilvl and num_id):
             return None
 
-        ilvl, num_id = ilvl_str, num_id_str  # type: ignore[assignment]
+        try:
+            num_def = self._numbering_definitions[num_id]
+            target_level = num_def.levels[ilvl]
+        except KeyError:
+            return None
 
-        num_def = self._numbering_definitions[num_id]
-        self._update_numbering_state(num_id, ilvl, num_def)
+        self._update_numbering_state(num_id, ilvl, num_def, target_level)
         return num_def.get_formatted_number(ilvl)
 
-    def _is_valid_numbering_info(
-        self,
-        ilvl: str | None,
-        num_id: str | None,
-    ) -> bool:
-        """Check if ilvl and numId constitute valid numbering information."""
-        if not ilvl or not num_id:
-            return False
-        num_def = self._numbering_definitions.get(num_id)
-        if not num_def or ilvl not in num_def.levels:
-            return False
-        return True
-
     def _update_numbering_state(
         self,
         num_id: str,
         current_ilvl_str: str,
         num_def: NumberingDefinition,
+        target_level: NumberingLevel,
     ) -> None:
         """Update numbering level values based on current and previous state."""
-        last_ilvl_str = self._last_active_levels.get(num_id)
-
-        if last_ilvl_str is not None:
-            try:
-                current_level_val = int(current_ilvl_str)
-                last_level_val = int(last_ilvl_str)
-            except ValueError:
-                self._last_active_levels[num_id] = current_ilvl_str
-                return
-
-            target_level = num_def.levels[current_ilvl_str]
-
-            if current_level_val > last_level_val:
-                pass
-            elif current_level_val < last_level_val:
-                target_level.increment()
-                num_def.reset_levels_below(current_ilvl_str)
-            else:
-                target_level.increment()
+        current_level_val = target_level.level_int
+        last_level_val = self._last_active_levels.get(num_id)
+        self._last_active_levels[num_id] = current_level_val
+
+        if (
+            last_level_val is None
+            or current_level_val is None
+            or current_level_val > last_level_val
+        ):
+            return
 
-        self._last_active_levels[num_id] = current_ilvl_str
+        target_level.increment()
+        if current_level_val < last_level_val:
+            num_def.reset_levels_below(current_ilvl_str)
 
 
 class DocumentCleaner:
     """Cleans elements from a document.xml structure."""
 
-    @staticmethod
-    def clean_numbering_references(document_root: EtreeElement) -> None:
-        """Remove specific w:numPr tags related to tracked changes or deletions.
-
-        Args:
-            document_root: The root element of the document.xml structure.
-        """
-
-        xpath_to_remove = (
-            "//w:pPrChange//w:numPr | "
-            "//w:rPrChange//w:numPr | "
-            "//w:p[@w:rsidDel]//w:numPr"
-        )
-        for num_pr_element in xml_utils.find_all_elements(
-            document_root,
-            xpath_to_remove,
-        ):
-            parent = num_pr_element.getparent()
-            if parent is not None:
-                parent.remove(num_pr_element)
-
     @staticmethod
     def remove_all_numpr_tags(paragraph_element: EtreeElement) -> None:
         """Remove all w:numPr tags from a given paragraph element.
@@ -141,13 +107,7 @@ class DocumentCleaner:
         Args:
             paragraph_element: The <w:p> lxml element.
         """
-        for num_pr_tag in xml_utils.find_all_elements(
-            paragraph_element,
-            ".//w:numPr",
-        ):
-            parent = num_pr_tag.getparent()
-            if parent is not None:
-                parent.remove(num_pr_tag)
+        etree.strip_elements(paragraph_element, W_NUMPR)
 
 
 def add_numbering_prefix_to_paragraph(
@@ -160,24 +120,38 @@ def add_numbering_prefix_to_paragraph(
         paragraph_element: The <w:p> lxml element.
         num_prefix: The numbering string to prepend (e.g., "1. ").
     """
-    first_text_run_text_element = xml_utils.find_element(
-        paragraph_element,
-        ".//w:r/w:t",
-    )
-
-    if first_text_run_text_element is not None:
-        current_text = first_text_run_text_element.text or ""
-
-        prefix_with_space = f"{num_prefix} "
-        first_text_run_text_element.text = f"{prefix_with_space}{current_text}"
+    first_text_element = None
+    wrapped_text_element = None
+    for child in paragraph_element.iterchildren():
+        if child.tag == W_R:
+            first_text_element = next(child.iterchildren(W_T), None)
+            if first_text_element is not None:
+                break
+        elif child.tag != W_PPR:
+            wrapped_text_element = next(child.iter(W_T), None)
+            if wrapped_text_element is not None:
+                # Text starts inside a wrapper (w:hyperlink, w:ins, ...), so
+                # the prefix gets a run of its own in front of it.
+                break
+
+    if first_text_element is not None:
+        current_text = first_text_element.text or ""
+        first_text_element.text = f"{num_prefix} {current_text}"
     else:
-
-        run_element = xml_utils.create_element("r")
-        text_element = xml_utils.create_element("t")
-        text_element.text = f"{num_prefix} "
-        run_element.append(text_element)
-
-        p_pr_element = xml_utils.find_element(paragraph_element, "./w:pPr")
+        run_element = paragraph_element.makeelement(W_R)
+        if wrapped_text_element is not None:
+            # Format the prefix like the run the text starts in.
+            text_run = wrapped_text_element.getparent()
+            r_pr_element = (
+                next(text_run.iterchildren(W_RPR), None)
+                if text_run is not None
+                else None
+            )
+            if r_pr_element is not None:
+                run_element.append(copy.deepcopy(r_pr_element))
+        etree.SubElement(run_element, W_T).text = f"{num_prefix} "
+
+        p_pr_element = next(paragraph_element.iterchildren(W_PPR), None)
         if p_pr_element is not None:
             p_pr_element.addnext(run_element)
         else:
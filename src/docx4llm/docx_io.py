@@ -1,28 +1,34 @@
-"""Handles I/O operations for DOCX files (unpacking and packing)."""
+"""Handles I/O operations for DOCX files (reading and repacking)."""
 
 from __future__ import annotations
 
-import os
+import copy
 import shutil
-import tempfile
 import zipfile
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING, Any
 
+from lxml import etree
 
+from docx4llm import xml_utils
 from docx4llm.constants import (
+    COPY_BUFFER_SIZE,
     DOCX_DOCUMENT_PART,
     DOCX_NUMBERING_PART,
-    TEMP_DIR_SUFFIX,
 )
 from docx4llm.exceptions import DocxProcessingError
 
 if TYPE_CHECKING:
-    pass
+    from lxml.etree import _ElementTree as EtreeElementTree
 
 
 class DocxFileHandler:
-    """Manages unpacking and packing of DOCX files."""
+    """Manages reading parts of a DOCX file and packing the modified copy.
+
+    The input archive is read in place; modified parts are kept as XML trees
+    and serialized only when the output archive is written, straight into
+    their output archive entries.
+    """
 
     def __init__(self, input_docx_path: str | Path) -> None:
         """Initialize with the path to the input DOCX file.
@@ -35,20 +41,15 @@ class DocxFileHandler:
             raise FileNotFoundError(
                 f"Input DOCX file not found: {self.input_path}"
             )
-        self._temp_dir_path: Path | None = None
+        self._input_zip: zipfile.ZipFile | None = None
+        self._tree_overrides: dict[str, EtreeElementTree] = {}
+        self._part_names: frozenset[str] = frozenset()
 
     def __enter__(self) -> DocxFileHandler:
-        """Enter context management: unpacks the DOCX to a temporary directory."""
-
-        self._temp_dir_path = Path(tempfile.mkdtemp(suffix=TEMP_DIR_SUFFIX))
-
-        if self._temp_dir_path.exists():
-            shutil.rmtree(self._temp_dir_path)
-        self._temp_dir_path.mkdir(parents=True, exist_ok=True)
-
+        """Enter context management: opens the DOCX archive for reading."""
         try:
-            with zipfile.ZipFile(self.input_path, "r") as zip_ref:
-                zip_ref.extractall(self._temp_dir_path)
+            self._input_zip = zipfile.ZipFile(self.input_path, "r")
+            self._part_names = frozenset(self._input_zip.namelist())
         except zipfile.BadZipFile as exc:
             self.cleanup()
             raise DocxProcessingError(
@@ -57,78 +58,126 @@ class DocxFileHandler:
         except Exception as exc:
             self.cleanup()
             raise DocxProcessingError(
-                f"Failed to extract DOCX file: {self.input_path}",
+                f"Failed to open DOCX file: {self.input_path}",
             ) from exc
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore[no-untyped-def]
-        """Exit context management: cleans up the temporary directory."""
+        """Exit context management: closes the archive and drops changes."""
         self.cleanup()
 
     def cleanup(self) -> None:
-        """Remove the temporary directory if it exists."""
-        if self._temp_dir_path and self._temp_dir_path.exists():
-            shutil.rmtree(self._temp_dir_path, ignore_errors=True)
-        self._temp_dir_path = None
-
-    def _assert_temp_dir(self) -> Path:
-        """Ensure the temporary directory is available."""
-        if not self._temp_dir_path or not self._temp_dir_path.is_dir():
+        """Close the input archive and discard any pending part overrides."""
+        if self._input_zip is not None:
+            self._input_zip.close()
+        self._input_zip = None
+        self._tree_overrides.clear()
+        self._part_names = frozenset()
+
+    def _assert_open(self) -> zipfile.ZipFile:
+        """Ensure the input archive is open."""
+        if self._input_zip is None:
             raise DocxProcessingError(
-                "Temporary directory not initialized or accessible.",
+                "DOCX archive is not open.",
             )
-        return self._temp_dir_path
+        return self._input_zip
+
+    def _require_part(self, part_name: str) -> zipfile.ZipFile:
+        """Return the open input archive, checking that it has a part.
+
+        Args:
+            part_name: The archive member that must be present.
+
+        Returns:
+            The open input archive.
 
-    def get_numbering_xml_content(self) -> bytes | None:
-        """Read the content of word/numbering.xml from the unpacked DOCX.
+        Raises:
+            DocxProcessingError: If the part is missing.
+
+        """
+        input_zip = self._assert_open()
+        if part_name not in self._part_names:
+            raise DocxProcessingError(f"Required part {part_name} missing.")
+        return input_zip
+
+    def open_numbering_xml(self) -> IO[bytes] | None:
+        """Open word/numbering.xml for reading straight from the archive.
 
         Returns:
-            Byte content of numbering.xml, or None if not found.
+            A binary stream over the decompressed part, to be closed by the
+            caller, or None if the part is missing or empty.
+
         """
-        temp_dir = self._assert_temp_dir()
-        numbering_path = temp_dir / DOCX_NUMBERING_PART
-        if numbering_path.exists():
-            return numbering_path.read_bytes()
-        return None
+        input_zip = self._assert_open()
+        if (
+            DOCX_NUMBERING_PART not in self._part_names
+            or input_zip.getinfo(DOCX_NUMBERING_PART).file_size == 0
+        ):
+            return None
+        return input_zip.open(DOCX_NUMBERING_PART)
+
+    def parse_document_xml(self) -> EtreeElementTree:
+        """Parse word/document.xml straight from the archive member.
 
-    def get_document_xml_content(self) -> bytes | None:
-        """Read the content of word/document.xml from the unpacked DOCX.
+        The parser reads the decompressed stream directly, so no intermediate
+        copy of the part's bytes is kept alongside the parsed tree.
 
         Returns:
-            Byte content of document.xml, or None if not found.
+            The parsed document.xml tree.
+
         """
-        temp_dir = self._assert_temp_dir()
-        document_path = temp_dir / DOCX_DOCUMENT_PART
-        if document_path.exists():
-            return document_path.read_bytes()
-        raise DocxProcessingError(
-            f"Required part {DOCX_DOCUMENT_PART} missing."
-        )
+        input_zip = self._require_part(DOCX_DOCUMENT_PART)
+        with input_zip.open(DOCX_DOCUMENT_PART) as document_part:
+            return etree.parse(document_part, xml_utils.XML_PARSER)
+
+    def write_document_xml_tree(self, document_tree: EtreeElementTree) -> None:
+        """Set a document.xml tree as the replacement for the part.
 
-    def write_document_xml_content(self, content: bytes) -> None:
-        """Write modified content back to word/document.xml in the temp dir.
+        The tree is serialized when the output archive is created, directly
+        into the archive entry, so no serialized copy is held in memory.
 
         Args:
-            content: The modified byte content for document.xml.
+            document_tree: The modified document.xml tree.
+
         """
-        temp_dir = self._assert_temp_dir()
-        document_path = temp_dir / DOCX_DOCUMENT_PART
-        document_path.write_bytes(content)
+        self._assert_open()
+        self._tree_overrides[DOCX_DOCUMENT_PART] = document_tree
 
     def create_output_docx(self, output_docx_path: str | Path) -> None:
-        """Create a new DOCX file from the contents of the temporary directory.
+        """Create a new DOCX file from the input archive and modified parts.
+
+        Entries are written in their original order, keeping their metadata
+        and compression method; overridden parts replace the original bytes.
+        Unchanged entries are streamed member to member in fixed-size chunks,
+        so large media parts are never held in memory as a whole.
 
         Args:
             output_docx_path: Path to save the new .docx file.
         """
-        source_dir = self._assert_temp_dir()
+        input_zip = self._assert_open()
         output_path = Path(output_docx_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for root_str, _, files in os.walk(source_dir):
-                root_path = Path(root_str)
-                for filename in files:
-                    file_path = root_path / filename
-                    arcname = file_path.relative_to(source_dir)
-                    zipf.write(file_path, arcname)
+            for zip_info in input_zip.infolist():
+                output_info = copy.copy(zip_info)
+                tree = self._tree_overrides.get(zip_info.filename)
+                if tree is not None:
+                    write_options: dict[str, Any] = {
+                        "encoding": "UTF-8",
+                        "xml_declaration": True,
+                    }
+                    # Keep the part's standalone declaration, if it had one.
+                    if tree.docinfo.standalone is not None:
+                        write_options["standalone"] = tree.docinfo.standalone
+                    with zipf.open(output_info, "w") as target:
+                        tree.write(target, **write_options)
+                    continue
+                if zip_info.is_dir():
+                    zipf.writestr(output_info, b"")
+                    continue
+                with (
+                    input_zip.open(zip_info) as source,
+                    zipf.open(output_info, "w") as target,
+                ):
+                    shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
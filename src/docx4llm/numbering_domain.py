@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import re
+from bisect import bisect_right
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from docx4llm.numbering_formats import INumberFormatter
 
+# A level template refers to level N (0-based) as "%{N+1}"; Word allows at
+# most nine levels, so placeholders are a single digit.
+_PLACEHOLDER_PATTERN = re.compile(r"%([1-9])")
+
 
 class NumberingLevel:
     """Represents a single level within a numbering definition."""
@@ -28,26 +37,70 @@ class NumberingLevel:
             start_value: The initial value for this numbering level.
         """
         self.level_id = level_id
-        self.formatter = formatter
+        try:
+            self.level_int: int | None = int(level_id)
+        except ValueError:
+            self.level_int = None
+        self._formatter = formatter
         self.text_template = text_template
-        self.start_value = start_value
-        self.current_value: int = start_value
+        self._start_value = start_value
+        self._current_value = start_value
+        self._formatted_value: str | None = None
+
+    @property
+    def formatter(self) -> INumberFormatter:
+        """The formatter used for this level's numbers."""
+        return self._formatter
+
+    @formatter.setter
+    def formatter(self, formatter: INumberFormatter) -> None:
+        self._formatter = formatter
+        self._formatted_value = None
+
+    @property
+    def start_value(self) -> int:
+        """The value this level starts from and is reset to."""
+        return self._start_value
+
+    @start_value.setter
+    def start_value(self, start_value: int) -> None:
+        self._start_value = start_value
+        self._formatted_value = None
+
+    @property
+    def current_value(self) -> int:
+        """The current value of this level."""
+        return self._current_value
+
+    @current_value.setter
+    def current_value(self, current_value: int) -> None:
+        self._current_value = current_value
+        self._formatted_value = None
 
     def reset(self) -> None:
         """Reset the current value of this level to its start value."""
-        self.current_value = self.start_value
+        self._current_value = self._start_value
+        self._formatted_value = None
 
     def increment(self) -> None:
         """Increment the current value of this level by one."""
-        self.current_value += 1
+        self._current_value += 1
+        self._formatted_value = None
 
     def format_current_value(self) -> str:
         """Format the current value of this level using its formatter.
 
+        The result is cached until the current value or the formatter
+        changes.
+
         Returns:
             The formatted string representation of the current value.
         """
-        return self.formatter.format(self.current_value)
+        if self._formatted_value is None:
+            self._formatted_value = self._formatter.format(
+                self._current_value,
+            )
+        return self._formatted_value
 
 
 class NumberingDefinition:
@@ -61,7 +114,44 @@ class NumberingDefinition:
                              this definition is based on.
         """
         self.abstract_num_id = abstract_num_id
-        self.levels: dict[str, NumberingLevel] = {}
+        self._levels: dict[str, NumberingLevel] = {}
+        self._level_source: Callable[[], Iterable[NumberingLevel]] | None = (
+            None
+        )
+        self._sorted_levels: list[tuple[int, NumberingLevel]] | None = None
+        self._sorted_level_ints: list[int] = []
+        self._compiled_templates: dict[
+            str,
+            tuple[tuple[str, ...], tuple[NumberingLevel, ...]],
+        ] = {}
+
+    @property
+    def levels(self) -> dict[str, NumberingLevel]:
+        """The levels of this definition, keyed by level ID.
+
+        Levels from a pending level source are added on first access.
+        """
+        if self._level_source is not None:
+            level_source, self._level_source = self._level_source, None
+            for level in level_source():
+                self.add_level(level)
+        return self._levels
+
+    def set_level_source(
+        self,
+        level_source: Callable[[], Iterable[NumberingLevel]],
+    ) -> None:
+        """Defer building this definition's levels until they are needed.
+
+        Most concrete numbering definitions in a document are never
+        referenced by a paragraph, so their levels are never built.
+
+        Args:
+            level_source: Called once, on first access to levels, to
+                          produce the levels to add.
+
+        """
+        self._level_source = level_source
 
     def add_level(self, level: NumberingLevel) -> None:
         """Add a numbering level to this definition.
@@ -69,7 +159,29 @@ class NumberingDefinition:
         Args:
             level: The NumberingLevel instance to add.
         """
-        self.levels[level.level_id] = level
+        self._levels[level.level_id] = level
+        self._sorted_levels = None
+        self._compiled_templates.clear()
+
+    def _get_sorted_levels(self) -> list[tuple[int, NumberingLevel]]:
+        """Return (level number, level) pairs for numeric level IDs.
+
+        The list is ordered by level number and built on first use after the
+        last add_level() call.
+        """
+        if self._sorted_levels is None:
+            self._sorted_levels = sorted(
+                (
+                    (level.level_int, level)
+                    for level in self.levels.values()
+                    if level.level_int is not None
+                ),
+                key=itemgetter(0),
+            )
+            self._sorted_level_ints = [
+                level_int for level_int, _ in self._sorted_levels
+            ]
+        return self._sorted_levels
 
     def reset_levels_below(self, current_level_id_str: str) -> None:
         """Reset all numbering levels numerically greater than the current one.
@@ -78,18 +190,21 @@ class NumberingDefinition:
             current_level_id_str: The ID of the current level (e.g., "0").
                                   Levels with IDs like "1", "2" will be reset.
         """
-        try:
-            current_level_int = int(current_level_id_str)
-        except ValueError:
-            return
-
-        for level_id, level in self.levels.items():
+        current_level = self.levels.get(current_level_id_str)
+        if current_level is not None:
+            current_level_int = current_level.level_int
+        else:
             try:
-                level_id_int = int(level_id)
-                if level_id_int > current_level_int:
-                    level.reset()
+                current_level_int = int(current_level_id_str)
             except ValueError:
-                continue
+                return
+        if current_level_int is None:
+            return
+
+        sorted_levels = self._get_sorted_levels()
+        first_below = bisect_right(self._sorted_level_ints, current_level_int)
+        for _, level in sorted_levels[first_below:]:
+            level.reset()
 
     def get_formatted_number(self, target_level_id: str) -> str:
         """Generate the formatted number string for a specific level.
@@ -108,16 +223,53 @@ class NumberingDefinition:
         if not target_level:
             return ""
 
-        text = target_level.text_template
+        compiled_template = self._compiled_templates.get(target_level_id)
+        if compiled_template is None:
+            compiled_template = self._compile_template(
+                target_level.text_template,
+            )
+            self._compiled_templates[target_level_id] = compiled_template
+
+        literals, referenced_levels = compiled_template
+        if not referenced_levels:
+            return literals[0]
 
-        sorted_level_ids = sorted(self.levels.keys(), key=int)
+        parts = [literals[0]]
+        for sub_level, literal in zip(
+            referenced_levels,
+            literals[1:],
+            strict=True,
+        ):
+            parts.extend((sub_level.format_current_value(), literal))
+        return "".join(parts)
 
-        for sub_level_id_str in sorted_level_ids:
-            sub_level = self.levels[sub_level_id_str]
-            placeholder = f"%{int(sub_level_id_str) + 1}"
-            if placeholder in text:
-                text = text.replace(
-                    placeholder,
-                    sub_level.format_current_value(),
-                )
-        return text
+    def _compile_template(
+        self,
+        text_template: str,
+    ) -> tuple[tuple[str, ...], tuple[NumberingLevel, ...]]:
+        """Split a level text template around the placeholders it uses.
+
+        Placeholders for levels this definition doesn't have stay in the
+        literal text.
+
+        Args:
+            text_template: The level's text template, e.g. "%1.%2.".
+
+        Returns:
+            The literal segments and the levels whose formatted values go
+            between them; there is always one more literal than level.
+
+        """
+        levels_by_int = dict(self._get_sorted_levels())
+        literals: list[str] = []
+        referenced_levels: list[NumberingLevel] = []
+        literal_start = 0
+        for match in _PLACEHOLDER_PATTERN.finditer(text_template):
+            sub_level = levels_by_int.get(int(match.group(1)) - 1)
+            if sub_level is None:
+                continue
+            literals.append(text_template[literal_start : match.start()])
+            referenced_levels.append(sub_level)
+            literal_start = match.end()
+        literals.append(text_template[literal_start:])
+        return tuple(literals), tuple(referenced_levels)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import string
 from abc import ABC, abstractmethod
 from typing import Final
 
@@ -9,6 +10,8 @@ from typing import Final
 class INumberFormatter(ABC):
     """Interface for number formatting strategies."""
 
+    __slots__ = ()
+
     @abstractmethod
     def format(self, number: int) -> str:
         """Format the given integer into a string representation.
@@ -21,29 +24,55 @@ class INumberFormatter(ABC):
         """
 
 
+_ROMAN_PAIRS: Final[tuple[tuple[int, str], ...]] = (
+    (1000, "M"),
+    (900, "CM"),
+    (500, "D"),
+    (400, "CD"),
+    (100, "C"),
+    (90, "XC"),
+    (50, "L"),
+    (40, "XL"),
+    (10, "X"),
+    (9, "IX"),
+    (5, "V"),
+    (4, "IV"),
+    (1, "I"),
+)
+_ROMAN_CACHE_LIMIT: Final = 4000
+
+
+def _build_roman(number: int) -> str:
+    """Build the Roman numeral for a positive integer from _ROMAN_PAIRS."""
+    result_parts = []
+    for value, numeral in _ROMAN_PAIRS:
+        count, number = divmod(number, value)
+        if count:
+            result_parts.append(numeral * count)
+    return "".join(result_parts)
+
+
+_ROMAN_CACHE: Final[tuple[str, ...]] = (
+    "",
+    *(_build_roman(number) for number in range(1, _ROMAN_CACHE_LIMIT)),
+)
+_LOWER_ROMAN_CACHE: Final[tuple[str, ...]] = tuple(
+    numeral.lower() for numeral in _ROMAN_CACHE
+)
+
+_UPPER_LETTERS: Final[tuple[str, ...]] = tuple(string.ascii_uppercase)
+_LOWER_LETTERS: Final[tuple[str, ...]] = tuple(string.ascii_lowercase)
+
+
 class _RomanNumeralHelper:
     """Helper class for Roman numeral conversion logic."""
 
-    _ROMAN_MAP: Final[dict[int, str]] = {
-        1000: "M",
-        900: "CM",
-        500: "D",
-        400: "CD",
-        100: "C",
-        90: "XC",
-        50: "L",
-        40: "XL",
-        10: "X",
-        9: "IX",
-        5: "V",
-        4: "IV",
-        1: "I",
-    }
-
     @staticmethod
     def to_roman(number: int) -> str:
         """Convert an integer to its Roman numeral representation.
 
+        Numbers below 4000 are served from a table built at import time.
+
         Args:
             number: The integer to convert. Must be positive.
 
@@ -55,22 +84,20 @@ class _RomanNumeralHelper:
                         Roman numeral representation (though this implementation
                         handles large numbers by repetition).
         """
+        if 0 < number < _ROMAN_CACHE_LIMIT:
+            return _ROMAN_CACHE[number]
         if number <= 0:
             raise ValueError(
                 "Roman numeral conversion requires a positive integer."
             )
-
-        result_parts = []
-        for value, numeral in _RomanNumeralHelper._ROMAN_MAP.items():
-            while number >= value:
-                result_parts.append(numeral)
-                number -= value
-        return "".join(result_parts)
+        return _build_roman(number)
 
 
 class DecimalFormatter(INumberFormatter):
     """Formats numbers as decimal strings."""
 
+    __slots__ = ()
+
     def format(self, number: int) -> str:
         """Format number as decimal. E.g., 1, 2, 3."""
         return str(number)
@@ -79,6 +106,8 @@ class DecimalFormatter(INumberFormatter):
 class UpperRomanFormatter(INumberFormatter):
     """Formats numbers as uppercase Roman numerals."""
 
+    __slots__ = ()
+
     def format(self, number: int) -> str:
         """Format number as uppercase Roman. E.g., I, II, III."""
         return _RomanNumeralHelper.to_roman(number)
@@ -87,36 +116,43 @@ class UpperRomanFormatter(INumberFormatter):
 class LowerRomanFormatter(INumberFormatter):
     """Formats numbers as lowercase Roman numerals."""
 
+    __slots__ = ()
+
     def format(self, number: int) -> str:
         """Format number as lowercase Roman. E.g., i, ii, iii."""
+        if 0 < number < _ROMAN_CACHE_LIMIT:
+            return _LOWER_ROMAN_CACHE[number]
         return _RomanNumeralHelper.to_roman(number).lower()
 
 
 class UpperLetterFormatter(INumberFormatter):
     """Formats numbers as uppercase letters."""
 
+    __slots__ = ()
+
     def format(self, number: int) -> str:
         """Format number as uppercase letter. E.g., A, B, C.
 
         Assumes 1-based indexing for letters (1=A, 2=B, ...).
         """
-        if number < 1 or number > 26:
-
-            return str(number)
-        return chr(ord("A") + number - 1)
+        if 0 < number <= len(_UPPER_LETTERS):
+            return _UPPER_LETTERS[number - 1]
+        return str(number)
 
 
 class LowerLetterFormatter(INumberFormatter):
     """Formats numbers as lowercase letters."""
 
+    __slots__ = ()
+
     def format(self, number: int) -> str:
         """Format number as lowercase letter. E.g., a, b, c.
 
         Assumes 1-based indexing for letters (1=a, 2=b, ...).
         """
-        if number < 1 or number > 26:
-            return str(number)
-        return chr(ord("a") + number - 1)
+        if 0 < number <= len(_LOWER_LETTERS):
+            return _LOWER_LETTERS[number - 1]
+        return str(number)
 
 
 class NumberingFormatterService:
@@ -131,7 +167,7 @@ class NumberingFormatterService:
             "upperLetter": UpperLetterFormatter(),
             "lowerLetter": LowerLetterFormatter(),
         }
-        self._default_formatter: INumberFormatter = DecimalFormatter()
+        self._default_formatter: INumberFormatter = self._formatters["decimal"]
 
     def get_formatter(self, format_type: str) -> INumberFormatter:
         """Retrieve a formatter for the specified type.
@@ -14,6 +14,11 @@ from docx4llm.exceptions import (
 
 TrackChangesOption = Literal["accept", "reject", "all"]
 
+_TRACK_CHANGES_ARGS: dict[str, tuple[str, ...]] = {
+    option: (f"--track-changes={option}",)
+    for option in ("accept", "reject", "all")
+}
+
 
 def convert_docx_to_format(
     input_docx_path: str | Path,
@@ -40,8 +45,10 @@ def convert_docx_to_format(
     if not input_path.exists():
         raise FileNotFoundError(f"Input DOCX file not found: {input_path}")
 
+    # Imported here so that importing docx4llm for numbering alone doesn't
+    # pay for loading pypandoc; later calls get it from sys.modules.
     try:
-        import pypandoc
+        import pypandoc  # ruff: ignore[import-outside-top-level]
     except ImportError:
         raise PandocNotInstalledError(
             "pypandoc library is not installed. "
@@ -50,13 +57,10 @@ def convert_docx_to_format(
 
     output_file_path = input_path.with_suffix(f".{output_format}")
 
-    extra_args = []
-    valid_track_changes: list[TrackChangesOption] = ["accept", "reject", "all"]
-    if track_changes not in valid_track_changes:
-        effective_track_changes: TrackChangesOption = "all"
-    else:
-        effective_track_changes = track_changes
-    extra_args.append(f"--track-changes={effective_track_changes}")
+    extra_args = _TRACK_CHANGES_ARGS.get(
+        track_changes,
+        _TRACK_CHANGES_ARGS["all"],
+    )
 
     try:
         pypandoc.convert_file(
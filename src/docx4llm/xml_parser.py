@@ -2,18 +2,79 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import functools
+import io
+import sys
+from dataclasses import dataclass, field
+from typing import IO, TYPE_CHECKING
 
 from lxml import etree
 
 from docx4llm import xml_utils
+from docx4llm.constants import (
+    W_ABSTRACTNUM,
+    W_ABSTRACTNUMID,
+    W_ILVL,
+    W_LVL,
+    W_LVLOVERRIDE,
+    W_LVLTEXT,
+    W_NUM,
+    W_NUMFMT,
+    W_NUMID,
+    W_START,
+    W_STARTOVERRIDE,
+    W_VAL,
+)
 from docx4llm.numbering_domain import NumberingDefinition, NumberingLevel
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from lxml.etree import _Element as EtreeElement
 
     from docx4llm.numbering_formats import NumberingFormatterService
 
+# Level text used when a <w:lvl> has no <w:lvlText>, keyed by level ID:
+# "0" -> "%1.", and so on for Word's nine levels.
+_DEFAULT_LVL_TEXTS = {str(level): f"%{level + 1}." for level in range(9)}
+
+
+def _safe_int[T](value: str | None, default: T) -> int | T:
+    """Convert a non-negative attribute value to int, or return a default.
+
+    Only plain ASCII digits are accepted: int() alone would also take signs,
+    surrounding whitespace and underscores ("-1", " 3", "1_0"), and a
+    negative start value breaks the Roman numeral formatters.
+
+    Args:
+        value: The attribute value, or None if the attribute is missing.
+        default: The value to return if value is missing or not a
+                 non-negative integer.
+
+    Returns:
+        The parsed integer, or default.
+
+    """
+    if value and value.isascii() and value.isdigit():
+        return int(value)
+    return default
+
+
+@dataclass(slots=True)
+class _AbstractLevel:
+    """A <w:lvl> of an abstract numbering definition, before formatting."""
+
+    num_format: str
+    text_template: str
+    start_value: int
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedNumbering:
+    """The numbering definitions parsed from one numbering.xml."""
+
+    definitions: dict[str, NumberingDefinition] = field(default_factory=dict)
+
 
 class NumberingParser:
     """Parses numbering information from numbering.xml content."""
@@ -25,153 +86,212 @@ class NumberingParser:
             formatter_service: Service to provide formatters for numbering levels.
         """
         self._formatter_service = formatter_service
-        self._abstract_num_definitions: dict[str, dict[str, dict[str, Any]]] = (
-            {}
-        )
-        self.numbering_definitions: dict[str, NumberingDefinition] = {}
 
-    def parse_numbering_xml(self, numbering_xml_content: bytes) -> None:
+    @classmethod
+    def parse(
+        cls,
+        numbering_part: IO[bytes],
+        formatter_service: NumberingFormatterService,
+    ) -> ParsedNumbering:
+        """Parse numbering.xml from a binary stream with a fresh parser.
+
+        Nothing is kept between calls, so one formatter service can be
+        shared across any number of documents.
+
+        Args:
+            numbering_part: A binary stream over the numbering.xml part.
+            formatter_service: Service to provide formatters for numbering
+                               levels.
+
+        Returns:
+            The parsed numbering definitions.
+
+        """
+        return cls(formatter_service).parse_numbering_stream(numbering_part)
+
+    def parse_numbering_xml(
+        self,
+        numbering_xml_content: bytes,
+    ) -> ParsedNumbering:
         """Parse the content of numbering.xml.
 
         Args:
             numbering_xml_content: The byte content of numbering.xml.
+
+        Returns:
+            The parsed numbering definitions.
+
+        """
+        return self.parse_numbering_stream(io.BytesIO(numbering_xml_content))
+
+    def parse_numbering_stream(
+        self,
+        numbering_part: IO[bytes],
+    ) -> ParsedNumbering:
+        """Parse numbering.xml incrementally from a binary stream.
+
+        Each <w:abstractNum> is cleared as soon as its levels are read, and
+        everything before the current element is detached from the root, so
+        the full tree is never held in memory; the small <w:num> elements are
+        kept and resolved once all abstract definitions are known.
+
+        Args:
+            numbering_part: A binary stream over the numbering.xml part.
+
+        Returns:
+            The parsed numbering definitions.
+
         """
-        numbering_root = etree.fromstring(numbering_xml_content)
-        self._parse_abstract_nums(numbering_root)
-        self._parse_concrete_nums(numbering_root)
-
-    def _parse_abstract_nums(self, numbering_root: EtreeElement) -> None:
-        """Parse <w:abstractNum> elements."""
-        self._abstract_num_definitions.clear()
-        for abstract_num_elem in xml_utils.find_all_elements(
-            numbering_root,
-            "//w:abstractNum",
+        abstract_num_definitions: dict[str, dict[str, _AbstractLevel]] = {}
+        num_elems: list[EtreeElement] = []
+        for _, element in etree.iterparse(
+            numbering_part,
+            events=("end",),
+            tag=(W_ABSTRACTNUM, W_NUM),
+            **xml_utils.NUMBERING_XML_PARSER_OPTIONS,
         ):
-            abstract_num_id = xml_utils.get_attribute(
-                abstract_num_elem,
-                "abstractNumId",
-            )
-            if not abstract_num_id:
-                continue
+            if element.tag == W_NUM:
+                num_elems.append(element)
+            else:
+                self._parse_abstract_num(element, abstract_num_definitions)
+                element.clear()
+            # Drop the elements already handled, and those skipped between
+            # them, such as <w:numPicBullet>, from the root.
+            parent = element.getparent()
+            if parent is not None:
+                del parent[: parent.index(element)]
+        return self._parse_concrete_nums(num_elems, abstract_num_definitions)
+
+    def _parse_abstract_num(
+        self,
+        abstract_num_elem: EtreeElement,
+        abstract_num_definitions: dict[str, dict[str, _AbstractLevel]],
+    ) -> None:
+        """Parse a single <w:abstractNum> into abstract_num_definitions."""
+        abstract_num_id = xml_utils.get_attribute(
+            abstract_num_elem,
+            "abstractNumId",
+        )
+        if not abstract_num_id:
+            return
 
-            self._abstract_num_definitions[abstract_num_id] = {}
-            self._parse_abstract_num_levels(
-                abstract_num_elem,
-                self._abstract_num_definitions[abstract_num_id],
-            )
+        abstract_num_definitions[abstract_num_id] = {}
+        self._parse_abstract_num_levels(
+            abstract_num_elem,
+            abstract_num_definitions[abstract_num_id],
+        )
 
     def _parse_abstract_num_levels(
         self,
         abstract_num_elem: EtreeElement,
-        num_data: dict[str, dict[str, Any]],
+        num_data: dict[str, _AbstractLevel],
     ) -> None:
         """Parse <w:lvl> elements within an <w:abstractNum>."""
-        for lvl_elem in xml_utils.find_all_elements(
-            abstract_num_elem,
-            ".//w:lvl",
-        ):
+        for lvl_elem in abstract_num_elem.iterchildren(W_LVL):
             lvl_id = xml_utils.get_attribute(lvl_elem, "ilvl")
             if not lvl_id:
                 continue
+            # Level IDs and format names come from a tiny vocabulary repeated
+            # across every abstractNum; interning shares one string per value.
+            lvl_id = sys.intern(lvl_id)
 
-            num_fmt_elem = xml_utils.find_element(lvl_elem, ".//w:numFmt")
+            num_fmt_elem = xml_utils.find_child(lvl_elem, W_NUMFMT)
             num_fmt_val = xml_utils.get_attribute(num_fmt_elem, "val")
-            num_fmt = num_fmt_val or "decimal"
+            num_fmt = sys.intern(num_fmt_val) if num_fmt_val else "decimal"
 
-            lvl_text_elem = xml_utils.find_element(lvl_elem, ".//w:lvlText")
+            lvl_text_elem = xml_utils.find_child(lvl_elem, W_LVLTEXT)
             lvl_text_val = xml_utils.get_attribute(lvl_text_elem, "val")
-            lvl_text = lvl_text_val or f"%{int(lvl_id)+1}."
+            lvl_text = (
+                lvl_text_val
+                or _DEFAULT_LVL_TEXTS.get(lvl_id)
+                or f"%{int(lvl_id) + 1}."
+            )
 
-            start_elem = xml_utils.find_element(lvl_elem, ".//w:start")
+            start_elem = xml_utils.find_child(lvl_elem, W_START)
             start_str = xml_utils.get_attribute(start_elem, "val")
-            start_val = (
-                int(start_str) if start_str and start_str.isdigit() else 1
-            )
+            start_val = _safe_int(start_str, 1)
 
-            num_data[lvl_id] = {
-                "format": num_fmt,
-                "text": lvl_text,
-                "start": start_val,
-            }
+            num_data[lvl_id] = _AbstractLevel(num_fmt, lvl_text, start_val)
 
-    def _parse_concrete_nums(self, numbering_root: EtreeElement) -> None:
+    def _parse_concrete_nums(
+        self,
+        num_elems: Iterable[EtreeElement],
+        abstract_num_definitions: dict[str, dict[str, _AbstractLevel]],
+    ) -> ParsedNumbering:
         """Parse <w:num> elements, creating NumberingDefinition instances."""
-        self.numbering_definitions.clear()
-        for num_elem in xml_utils.find_all_elements(
-            numbering_root,
-            "//w:num",
-        ):
+        numbering_definitions: dict[str, NumberingDefinition] = {}
+        for num_elem in num_elems:
             num_id = xml_utils.get_attribute(num_elem, "numId")
             if not num_id:
                 continue
 
-            abstract_num_id_elem = xml_utils.find_element(
+            abstract_num_id_elem = xml_utils.find_child(
                 num_elem,
-                ".//w:abstractNumId",
+                W_ABSTRACTNUMID,
             )
             abstract_num_id_val = xml_utils.get_attribute(
                 abstract_num_id_elem,
                 "val",
             )
-            if (
-                not abstract_num_id_val
-                or abstract_num_id_val not in self._abstract_num_definitions
-            ):
+            if not abstract_num_id_val:
+                continue
+            abstract_data = abstract_num_definitions.get(abstract_num_id_val)
+            if abstract_data is None:
                 continue
 
             num_def = NumberingDefinition(abstract_num_id_val)
-            self._populate_num_def_levels(
-                num_def,
-                self._abstract_num_definitions[abstract_num_id_val],
+            num_def.set_level_source(
+                functools.partial(
+                    self._build_num_def_levels,
+                    abstract_data,
+                    self._parse_start_overrides(num_elem, abstract_data),
+                ),
             )
-            self._apply_level_overrides(num_elem, num_def)
-            self.numbering_definitions[num_id] = num_def
+            numbering_definitions[num_id] = num_def
 
-    def _populate_num_def_levels(
+        return ParsedNumbering(numbering_definitions)
+
+    def _build_num_def_levels(
         self,
-        num_def: NumberingDefinition,
-        abstract_data: dict[str, dict[str, Any]],
-    ) -> None:
-        """Populate NumberingDefinition with levels from abstract definition."""
-        for lvl_id, lvl_data in abstract_data.items():
-            formatter = self._formatter_service.get_formatter(
-                lvl_data["format"]
-            )
-            level = NumberingLevel(
+        abstract_data: dict[str, _AbstractLevel],
+        start_overrides: dict[str, int],
+    ) -> list[NumberingLevel]:
+        """Build the levels of a concrete num from its abstract definition."""
+        return [
+            NumberingLevel(
                 level_id=lvl_id,
-                formatter=formatter,
-                text_template=lvl_data["text"],
-                start_value=lvl_data["start"],
+                formatter=self._formatter_service.get_formatter(
+                    lvl_data.num_format,
+                ),
+                text_template=lvl_data.text_template,
+                start_value=start_overrides.get(lvl_id, lvl_data.start_value),
             )
-            num_def.add_level(level)
+            for lvl_id, lvl_data in abstract_data.items()
+        ]
 
-    def _apply_level_overrides(
-        self,
+    @staticmethod
+    def _parse_start_overrides(
         num_elem: EtreeElement,
-        num_def: NumberingDefinition,
-    ) -> None:
-        """Apply <w:lvlOverride> settings to the NumberingDefinition."""
-        for lvl_override_elem in xml_utils.find_all_elements(
-            num_elem,
-            ".//w:lvlOverride",
-        ):
+        abstract_data: dict[str, _AbstractLevel],
+    ) -> dict[str, int]:
+        """Parse <w:lvlOverride> start values, keyed by level ID."""
+        start_overrides: dict[str, int] = {}
+        for lvl_override_elem in num_elem.iterchildren(W_LVLOVERRIDE):
             lvl_id = xml_utils.get_attribute(lvl_override_elem, "ilvl")
-            if not lvl_id or lvl_id not in num_def.levels:
+            if not lvl_id or lvl_id not in abstract_data:
                 continue
 
-            start_override_elem = xml_utils.find_element(
+            start_override_elem = xml_utils.find_child(
                 lvl_override_elem,
-                ".//w:startOverride",
+                W_STARTOVERRIDE,
+            )
+            new_start_val = _safe_int(
+                xml_utils.get_attribute(start_override_elem, "val"),
+                None,
             )
-            if start_override_elem is not None:
-                new_start_str = xml_utils.get_attribute(
-                    start_override_elem, "val"
-                )
-                if new_start_str and new_start_str.isdigit():
-                    new_start_val = int(new_start_str)
-                    overridden_level = num_def.levels[lvl_id]
-                    overridden_level.start_value = new_start_val
-                    overridden_level.reset()
+            if new_start_val is not None:
+                start_overrides[lvl_id] = new_start_val
+        return start_overrides
 
 
 def parse_numpr_info(
@@ -188,10 +308,10 @@ def parse_numpr_info(
     if numpr_element is None:
         return None, None
 
-    ilvl_element = xml_utils.find_element(numpr_element, ".//w:ilvl")
-    num_id_element = xml_utils.find_element(numpr_element, ".//w:numId")
+    ilvl_element = xml_utils.find_child(numpr_element, W_ILVL)
+    num_id_element = xml_utils.find_child(numpr_element, W_NUMID)
 
-    ilvl = xml_utils.get_attribute(ilvl_element, "val")
-    num_id = xml_utils.get_attribute(num_id_element, "val")
+    ilvl = ilvl_element.get(W_VAL) if ilvl_element is not None else None
+    num_id = num_id_element.get(W_VAL) if num_id_element is not None else None
 
     return ilvl, num_id
@@ -2,46 +2,65 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypedDict
 
 from lxml import etree
 
-from docx4llm.constants import NAMESPACES, WORDPROCESSINGML_NAMESPACE
+from docx4llm.constants import (
+    W_ATTRIBUTES,
+    WORDPROCESSINGML_NAMESPACE,
+)
 
 if TYPE_CHECKING:
     from lxml.etree import _Element as EtreeElement
 
 
-def find_element(
-    parent: EtreeElement,
-    xpath: str,
-) -> EtreeElement | None:
-    """Find a single XML element using XPath.
+class _ParserOptions(TypedDict, total=False):
+    """Keyword options shared by etree.XMLParser and etree.iterparse."""
 
-    Args:
-        parent: The parent lxml element to search within.
-        xpath: The XPath expression.
+    collect_ids: bool
+    resolve_entities: bool
+    huge_tree: bool
+    remove_blank_text: bool
+    remove_comments: bool
 
-    Returns:
-        The found lxml element, or None if not found.
-    """
-    return parent.find(xpath, namespaces=NAMESPACES)
 
+# DOCX parts never rely on xml:id lookups or entity expansion, so the shared
+# parser skips both; huge_tree lifts libxml2's limits for very large parts.
+XML_PARSER_OPTIONS: _ParserOptions = {
+    "collect_ids": False,
+    "resolve_entities": False,
+    "huge_tree": True,
+}
+XML_PARSER = etree.XMLParser(**XML_PARSER_OPTIONS)
+# numbering.xml is only read, never written back, and all its data lives in
+# attributes, so whitespace-only text and comments can be dropped as well.
+# These are passed to etree.iterparse(), which takes no parser object.
+NUMBERING_XML_PARSER_OPTIONS: _ParserOptions = {
+    **XML_PARSER_OPTIONS,
+    "remove_blank_text": True,
+    "remove_comments": True,
+}
 
-def find_all_elements(
+
+def find_child(
     parent: EtreeElement,
-    xpath: str,
-) -> list[EtreeElement]:
-    """Find all XML elements matching an XPath expression.
+    clark_tag: str,
+) -> EtreeElement | None:
+    """Find the first direct child with the given tag.
+
+    This takes a Clark-notation tag (see constants.py) rather than an
+    XPath, so no namespace resolution is involved.
 
     Args:
-        parent: The parent lxml element or document root to search within.
-        xpath: The XPath expression.
+        parent: The parent lxml element.
+        clark_tag: The child tag in Clark notation, e.g. W_LVL.
 
     Returns:
-        A list of found lxml elements.
+        The first matching child, or None if there is none.
+
     """
-    return parent.xpath(xpath, namespaces=NAMESPACES)  # type: ignore[no-any-return]
+    return next(parent.iterchildren(clark_tag), None)
 
 
 def get_attribute(
@@ -62,33 +81,8 @@ def get_attribute(
     """
     if element is None:
         return None
-    namespaced_attribute_name = f"{{{namespace_uri}}}{attribute_name}"
-    return element.get(namespaced_attribute_name)
-
-
-def create_element(
-    tag_name: str,
-    attributes: dict[str, str] | None = None,
-    namespace_uri: str = WORDPROCESSINGML_NAMESPACE,
-) -> EtreeElement:
-    """Create a new namespaced XML element.
-
-    Args:
-        tag_name: The local name of the element tag.
-        attributes: A dictionary of attributes to set on the element.
-                    Keys are local attribute names, values are attribute values.
-                    These attributes will also be namespaced with namespace_uri.
-        namespace_uri: The namespace URI for the element and its attributes.
-                       Defaults to WordProcessingML namespace.
-
-    Returns:
-        The created lxml element.
-    """
-    full_tag_name = f"{{{namespace_uri}}}{tag_name}"
-    element = etree.Element(full_tag_name, nsmap=NAMESPACES)
-
-    if attributes:
-        for attr_name, attr_value in attributes.items():
-            full_attr_name = f"{{{namespace_uri}}}{attr_name}"
-            element.set(full_attr_name, attr_value)
-    return element
+    if namespace_uri == WORDPROCESSINGML_NAMESPACE:
+        clark_name = W_ATTRIBUTES.get(attribute_name)
+        if clark_name is not None:
+            return element.get(clark_name)
+    return element.get(f"{{{namespace_uri}}}{attribute_name}")
@@ -0,0 +1,66 @@
+"""Run add_numbering_to_docx_batch and compare it with single-file runs."""
+
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+from docx4llm import add_numbering_to_docx, add_numbering_to_docx_batch
+
+input_file = "tests/data/test_docx.docx"
+missing_file = "tests/data/missing.docx"
+document_part = "word/document.xml"
+
+
+def read_document_xml(docx_path):
+    """Return the word/document.xml bytes of a DOCX file."""
+    with zipfile.ZipFile(docx_path) as docx_zip:
+        return docx_zip.read(document_part)
+
+
+def main():
+    """Check batch results, outputs and numbering against in-process runs."""
+    with tempfile.TemporaryDirectory() as output_dir:
+        docx_paths = [
+            (input_file, Path(output_dir, "first.docx")),
+            (input_file, Path(output_dir, "second.docx")),
+            (missing_file, Path(output_dir, "missing.docx")),
+        ]
+        expected_results = [True, True, False]
+
+        results = add_numbering_to_docx_batch(docx_paths)
+
+        reference_output = Path(output_dir, "reference.docx")
+        add_numbering_to_docx(input_file, reference_output)
+        expected_document_xml = read_document_xml(reference_output)
+
+        failures = []
+        if results != expected_results:
+            failures.append(f"expected results {expected_results}, got {results}")
+        for (source, output), expected in zip(
+            docx_paths,
+            expected_results,
+            strict=True,
+        ):
+            if output.is_file() != expected:
+                failures.append(
+                    f"output for '{source}' at '{output}' "
+                    f"{'is missing' if expected else 'should not exist'}",
+                )
+            elif expected and (
+                read_document_xml(output) != expected_document_xml
+            ):
+                failures.append(
+                    f"numbering in '{output}' differs from an in-process "
+                    f"add_numbering_to_docx run",
+                )
+
+    if failures:
+        for failure in failures:
+            print(f"FAILED: {failure}")
+        sys.exit(1)
+    print(f"Successfully processed batch of {len(docx_paths)} files: {results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Run the docx-num-converter command line in batch mode."""
+
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from docx4llm.cli import check_pandoc_installed, main_cli
+
+input_file = "tests/data/test_docx.docx"
+
+
+def run_cli(argv):
+    """Run the CLI, returning its exit status."""
+    try:
+        main_cli(argv)
+    except SystemExit as exc:
+        return exc.code or 0
+    return 0
+
+
+def main():
+    """Check batch runs, -o, a failing file and, with Pandoc, -f."""
+    failures = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        first = Path(shutil.copy(input_file, Path(work_dir, "first.docx")))
+        second = Path(shutil.copy(input_file, Path(work_dir, "second.docx")))
+
+        # Several paths: each numbered copy is saved next to its source.
+        status = run_cli([str(first), str(second)])
+        if status != 0:
+            failures.append(f"batch run exited with status {status}")
+        failures.extend(
+            f"batch output '{output}' is missing"
+            for output in (
+                Path(work_dir, "first_numbered.docx"),
+                Path(work_dir, "second_numbered.docx"),
+            )
+            if not output.is_file()
+        )
+
+        # -o with a single path.
+        output = Path(work_dir, "out", "custom.docx")
+        status = run_cli([str(first), "-o", str(output)])
+        if status != 0 or not output.is_file():
+            failures.append(f"-o run exited with {status}, output '{output}'")
+
+        # A failing file makes the run exit with status 1. The error log is
+        # written to the working directory, so keep it in work_dir.
+        cwd = Path.cwd()
+        os.chdir(work_dir)
+        try:
+            status = run_cli([str(first), str(Path(work_dir, "missing.docx"))])
+            logging.shutdown()
+        finally:
+            os.chdir(cwd)
+        if status != 1:
+            failures.append(f"run with a missing file exited with {status}")
+
+        # -f/--track-changes need Pandoc.
+        if check_pandoc_installed():
+            status = run_cli(
+                [str(first), "-f", "markdown", "--track-changes", "accept"],
+            )
+            converted = Path(work_dir, "first_numbered.markdown")
+            if status != 0 or not converted.is_file():
+                failures.append(
+                    f"-f run exited with {status}, output '{converted}'",
+                )
+        else:
+            print("Pandoc not found, skipping the --format run")
+
+    if failures:
+        for failure in failures:
+            print(f"FAILED: {failure}")
+        sys.exit(1)
+    print("CLI runs finished successfully")
+
+
+if __name__ == "__main__":
+    main()
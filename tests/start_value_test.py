@@ -0,0 +1,67 @@
+"""Check that invalid numbering start values are ignored."""
+
+import io
+import sys
+
+from docx4llm.numbering_formats import NumberingFormatterService
+from docx4llm.xml_parser import NumberingParser
+
+numbering_xml = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:numbering xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:abstractNum w:abstractNumId="0">
+    <w:lvl w:ilvl="0">
+      <w:start w:val="-1"/>
+      <w:numFmt w:val="upperRoman"/>
+      <w:lvlText w:val="%1."/>
+    </w:lvl>
+  </w:abstractNum>
+  <w:abstractNum w:abstractNumId="1">
+    <w:lvl w:ilvl="0">
+      <w:start w:val="3"/>
+      <w:numFmt w:val="upperRoman"/>
+      <w:lvlText w:val="%1."/>
+    </w:lvl>
+  </w:abstractNum>
+  <w:num w:numId="1">
+    <w:abstractNumId w:val="0"/>
+  </w:num>
+  <w:num w:numId="2">
+    <w:abstractNumId w:val="1"/>
+    <w:lvlOverride w:ilvl="0">
+      <w:startOverride w:val="-1"/>
+    </w:lvlOverride>
+  </w:num>
+</w:numbering>
+"""
+
+
+def main():
+    """Check invalid start and startOverride values on upperRoman levels."""
+    numbering = NumberingParser.parse(
+        io.BytesIO(numbering_xml),
+        NumberingFormatterService(),
+    )
+    expected_numbers = {
+        # <w:start w:val="-1"/> falls back to 1.
+        "1": "I.",
+        # <w:startOverride w:val="-1"/> keeps the abstract start of 3.
+        "2": "III.",
+    }
+
+    failures = []
+    for num_id, expected in expected_numbers.items():
+        number = numbering.definitions[num_id].get_formatted_number("0")
+        if number != expected:
+            failures.append(
+                f"numId {num_id}: expected {expected!r}, got {number!r}",
+            )
+
+    if failures:
+        for failure in failures:
+            print(f"FAILED: {failure}")
+        sys.exit(1)
+    print("Invalid start values are ignored")
+
+
+if __name__ == "__main__":
+    main()